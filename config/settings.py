@@ -187,6 +187,15 @@ else:
     MEDIA_URL = "/media/"
     MEDIA_ROOT = BASE_DIR / "media"
 
+# Offload video byte-serving to a fronting nginx via X-Accel-Redirect.
+# When enabled, serve_video returns an empty response with an
+# X-Accel-Redirect header pointing at /internal-media/<pmid>/..., and nginx
+# streams the file with sendfile instead of Python copying every byte.
+# Requires an internal location in nginx, e.g.:
+#   location /internal-media/ { internal; alias /app/media/; sendfile on; }
+# Only applies to local-filesystem serving (not cloud storage).
+USE_X_ACCEL_REDIRECT = os.getenv("USE_X_ACCEL_REDIRECT", "False") == "True"
+
 # Authentication settings
 LOGIN_URL = "/login/"
 LOGIN_REDIRECT_URL = "/"
@@ -229,6 +238,24 @@ CELERY_BROKER_URL = (
 # Celery result backend (optional, for storing task results)
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
 
+# Django cache: share the Redis instance Celery already uses when one is
+# configured (so e.g. paper-ID validation results are shared across web
+# processes); fall back to the default per-process local-memory cache in
+# development where Redis may not be running. Gated on the URL scheme, not
+# just the env vars being set — CELERY_BROKER_URL may point at RabbitMQ,
+# which RedisCache cannot talk to. The env-var check keeps development on
+# the local-memory default (the fallback URL is redis://localhost even when
+# nothing is listening there).
+if (
+    os.getenv("CELERY_BROKER_URL") or os.getenv("REDIS_URL") or os.getenv("REDISCLOUD_URL")
+) and CELERY_BROKER_URL.startswith("redis"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CELERY_BROKER_URL,
+        }
+    }
+
 # Celery task serialization
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-09-01 04:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('web', '0004_abtestevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='videogenerationjob',
+            index=models.Index(fields=['paper_id', '-created_at'], name='web_videoge_paper_i_44ae7c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videogenerationjob',
+            index=models.Index(fields=['paper_id', 'user', '-created_at'], name='web_videoge_paper_i_7f6a65_idx'),
+        ),
+    ]
@@ -44,6 +44,11 @@ class VideoGenerationJob(models.Model):
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['status']),
             models.Index(fields=['paper_id']),
+            # Status polling looks up the latest job per paper (optionally
+            # scoped to a user); these let that resolve as an index probe
+            # instead of a filter + sort.
+            models.Index(fields=['paper_id', '-created_at']),
+            models.Index(fields=['paper_id', 'user', '-created_at']),
         ]
     
     def __str__(self):
@@ -23,6 +23,10 @@ from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
+# Tail window for log reads; matches web.views so both sides classify from
+# the same amount of context.
+_LOG_TAIL_BYTES = 64 * 1024
+
 
 def _parse_pipeline_progress(line: str, current_progress: dict) -> Optional[dict]:
     """
@@ -759,9 +763,12 @@ def _extract_error_from_log(log_path: Path) -> str:
         return "Pipeline log file not found"
     
     try:
-        # Read last 8KB of log file
+        # Read the last _LOG_TAIL_BYTES of the log. Seek from the end:
+        # f.tell() on a fresh handle is 0, so the old max(0, f.tell() - 8192)
+        # read the whole file from the start.
+        size = log_path.stat().st_size
         with open(log_path, "rb") as f:
-            f.seek(max(0, f.tell() - 8192))
+            f.seek(-min(_LOG_TAIL_BYTES, size), os.SEEK_END)
             log_content = f.read().decode(errors="replace")
         
         # Try to find error messages
@@ -861,6 +868,8 @@ def test_volume_write_task(self) -> Dict:
     from django.utils import timezone
     
     try:
+        # One timestamp for the file content and the result payload
+        now = timezone.now()
         output_path = Path(settings.MEDIA_ROOT)
         
         # Create test directory if needed
@@ -870,7 +879,7 @@ def test_volume_write_task(self) -> Dict:
         # Write a test file with timestamp
         test_file = test_dir / "test_write_celery.txt"
         task_id = self.request.id if hasattr(self, 'request') else 'N/A'
-        test_content = f"Volume test - {timezone.now().isoformat()}\nService: Celery Worker\nMEDIA_ROOT: {output_path}\nTask ID: {task_id}"
+        test_content = f"Volume test - {now.isoformat()}\nService: Celery Worker\nMEDIA_ROOT: {output_path}\nTask ID: {task_id}"
         test_file.write_text(test_content)
         
         # Verify we can read it back
@@ -890,7 +899,7 @@ def test_volume_write_task(self) -> Dict:
             "test_file_readable": True,
             "test_content_matches": read_back == test_content,
             "task_id": task_id,
-            "timestamp": timezone.now().isoformat(),
+            "timestamp": now.isoformat(),
         }
         
         # Clean up test file (optional - leave it for debugging)
@@ -909,7 +918,7 @@ def test_volume_write_task(self) -> Dict:
         }
 
 
-def update_job_progress_from_files(pmid: str, task_id: Optional[str] = None) -> None:
+def update_job_progress_from_files(pmid: str, task_id: Optional[str] = None):
     """
     Update job progress in database based on file existence checks.
     
@@ -919,6 +928,11 @@ def update_job_progress_from_files(pmid: str, task_id: Optional[str] = None) ->
     Args:
         pmid: PubMed ID
         task_id: Optional task ID to find the job record
+        
+    Returns:
+        The up-to-date VideoGenerationJob row, or None if no matching job
+        was found or it's no longer running. Callers that need the fresh
+        state can use this instead of a follow-up refresh_from_db() SELECT.
     """
     from django.db import connections
     
@@ -934,29 +948,29 @@ def update_job_progress_from_files(pmid: str, task_id: Optional[str] = None) ->
                 job = VideoGenerationJob.objects.get(task_id=task_id)
             except VideoGenerationJob.DoesNotExist:
                 logger.debug(f"Job not found for task_id {task_id}")
-                return
+                return None
         else:
             # Try to find most recent job for this paper_id
             try:
                 job = VideoGenerationJob.objects.filter(paper_id=pmid).order_by('-created_at').first()
                 if not job:
                     logger.debug(f"No job found for paper_id {pmid}")
-                    return
+                    return None
             except Exception as e:
                 logger.warning(f"Error finding job for {pmid}: {e}")
-                return
+                return None
         
         # Only update if job is still running
         if job.status not in ['pending', 'running']:
             logger.debug(f"Job {job.id} is not in pending/running state (status: {job.status}), skipping update")
-            return
+            return None
         
         output_dir = Path(settings.MEDIA_ROOT) / pmid
         
         # Ensure output directory exists (might not exist yet if pipeline just started)
         if not output_dir.exists():
             logger.debug(f"Output directory does not exist yet: {output_dir}")
-            return
+            return job
         
         # Check pipeline steps (4 steps: 25%, 50%, 75%, 100%)
         steps = [
@@ -1003,8 +1017,10 @@ def update_job_progress_from_files(pmid: str, task_id: Optional[str] = None) ->
             logger.info(f"Job progress updated successfully")
         else:
             logger.debug(f"Job progress unchanged: {progress_percent}%, step: {current_step}")
+        return job
     except Exception as e:
         logger.warning(f"Failed to update job progress from files: {e}", exc_info=True)
+        return None
     finally:
         # Always close database connections when done (critical for threads)
         try:
@@ -1028,13 +1044,14 @@ def test_r2_storage_write_task(self) -> Dict:
     from django.core.files.base import ContentFile
     
     try:
-        # Generate unique test filename
-        test_filename = f"test_files/celery_test_{timezone.now().strftime('%Y%m%d_%H%M%S')}.txt"
+        # One timestamp for the filename, file content and result payload
+        now = timezone.now()
+        test_filename = f"test_files/celery_test_{now.strftime('%Y%m%d_%H%M%S')}.txt"
         task_id = self.request.id if hasattr(self, 'request') else 'N/A'
         
         # Create test content
         test_content = (
-            f"R2 Storage Test - {timezone.now().isoformat()}\n"
+            f"R2 Storage Test - {now.isoformat()}\n"
             f"Service: Celery Worker\n"
             f"Task ID: {task_id}\n"
             f"Storage Backend: {type(default_storage).__name__}\n"
@@ -1059,7 +1076,7 @@ def test_r2_storage_write_task(self) -> Dict:
                 "storage_backend": type(default_storage).__name__,
                 "use_cloud_storage": getattr(settings, 'USE_CLOUD_STORAGE', False),
                 "task_id": task_id,
-                "timestamp": timezone.now().isoformat(),
+                "timestamp": now.isoformat(),
             }
             
             # Get file URL if available
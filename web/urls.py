@@ -2,7 +2,7 @@ from django.contrib.auth.views import LoginView, LogoutView
 from django.urls import path
 from .views import (
     home, health, static_debug, upload_paper, pipeline_status, pipeline_result, register,
-    api_start_generation, api_status, api_result, serve_video, my_videos, debug_video_files,
+    api_start_generation, api_status, api_result, api_log_tail, serve_video, my_videos, debug_video_files,
     test_r2_storage, analytics_endpoint, analytics_track_click
 )
 
@@ -23,6 +23,7 @@ urlpatterns = [
     # API endpoints
     path("api/generate/", api_start_generation, name="api_start_generation"),
     path("api/status/<str:paper_id>/", api_status, name="api_status"),
+    path("api/log/<str:paper_id>/", api_log_tail, name="api_log_tail"),
     path("api/result/<str:paper_id>/", api_result, name="api_result"),
     # Analytics endpoint (SHA1 hash of "hidden-hill" = e9ec8bb)
     path("e9ec8bb/", analytics_endpoint, name="analytics_endpoint"),